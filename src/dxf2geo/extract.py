@@ -13,16 +13,36 @@ field sanitisation, and logging are implemented to support robust automated use.
 from __future__ import annotations
 
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
+from functools import lru_cache
 import logging
+import logging.handlers
+import os
 from pathlib import Path
 import re
+import sys
 
 import geopandas as gpd
+import numpy as np
+import pandas as pd
+from pyogrio import get_gdal_config_option, set_gdal_config_options
+import shapely
 from tqdm.auto import tqdm
 
+try:  # optional: enables Arrow-accelerated reads through Pyogrio
+    import pyarrow  # noqa: F401
+
+    _HAVE_PYARROW = True
+except ImportError:
+    _HAVE_PYARROW = False
+
 PathLike = str | Path
 
+# Canonical OGR driver names keyed by upper-cased user input
+_DRIVER_NAMES = {"ESRI SHAPEFILE": "ESRI Shapefile", "GPKG": "GPKG"}
+
 
 # Exceptions
 class ExtractError(Exception):
@@ -52,13 +72,15 @@ class FilterOptions:
     exclude_layers : tuple of str, optional
         Exact layer names to exclude. Matching is case-insensitive. Any match
         vetoes inclusion.
-    include_layer_patterns : tuple of str, optional
-        Regular expressions applied to the original layer name with
-        ``re.IGNORECASE``. If any include names or patterns are provided,
-        a layer must match at least one to pass.
-    exclude_layer_patterns : tuple of str, optional
-        Regular expressions applied to the original layer name with
-        ``re.IGNORECASE``. Any match vetoes inclusion.
+    include_layer_patterns : tuple of str or re.Pattern, optional
+        Regular expressions applied to the original layer name. Strings are
+        compiled with ``re.IGNORECASE``; pre-compiled patterns are used
+        exactly as compiled, so their own flags apply. If any include names
+        or patterns are provided, a layer must match at least one to pass.
+    exclude_layer_patterns : tuple of str or re.Pattern, optional
+        Regular expressions applied to the original layer name, with the
+        same string/pre-compiled handling as the include patterns. Any
+        match vetoes inclusion.
     drop_empty : bool, optional
         If ``True``, drop features whose geometry is empty.
     drop_zero_geom : bool, optional
@@ -81,8 +103,8 @@ class FilterOptions:
 
     include_layers: tuple[str, ...] | None = None
     exclude_layers: tuple[str, ...] | None = None
-    include_layer_patterns: tuple[str, ...] | None = None
-    exclude_layer_patterns: tuple[str, ...] | None = None
+    include_layer_patterns: tuple[str | re.Pattern[str], ...] | None = None
+    exclude_layer_patterns: tuple[str | re.Pattern[str], ...] | None = None
     min_area: float | None = None
     min_length: float | None = None
     drop_empty: bool = True
@@ -153,7 +175,7 @@ def extract_geometries(
         does not override an existing CRS; it logs and ignores the hint.
     """
     output_format_upper = output_format.upper()
-    if output_format_upper not in ("ESRI SHAPEFILE", "GPKG"):
+    if output_format_upper not in _DRIVER_NAMES:
         raise ValueError("Unsupported output format. Use 'ESRI Shapefile' or 'GPKG'.")
     if flatten and output_format_upper == "ESRI SHAPEFILE":
         raise ValueError(
@@ -172,74 +194,211 @@ def extract_geometries(
         dxf_path=dxf_path,
         output_root=output_root,
         flatten=flatten,
-        driver_name=(
-            "ESRI Shapefile" if output_format_upper == "ESRI SHAPEFILE" else "GPKG"
-        ),
+        driver_name=_DRIVER_NAMES[output_format_upper],
         geometry_types=tuple(geometry_types),
         raise_on_error=raise_on_error,
         filter_options=filter_options,
     )
 
-    logger.info("Opening DXF with GeoPandas/Pyogrio: %s", dxf_path)
     try:
-        gdf = _read_dxf(dxf_path, options.filter_options)
-    except Exception as e:
-        raise InputOpenError(f"Failed to read DXF: {dxf_path} ({e})") from e
-
-    # Assign a CRS if the source lacks one and the caller supplied a hint
-    if assume_crs is not None:
+        logger.info("Opening DXF with GeoPandas/Pyogrio: %s", dxf_path)
+        try:
+            with _tuned_gdal_config():
+                gdf = _read_dxf(dxf_path, options.filter_options)
+        except Exception as e:
+            raise InputOpenError(f"Failed to read DXF: {dxf_path} ({e})") from e
+
+        # Assign a CRS if the source lacks one and the caller supplied a hint
+        if assume_crs is not None:
+            if gdf.crs is None:
+                try:
+                    gdf = gdf.set_crs(assume_crs, allow_override=True)
+                    logger.info("Assigned CRS %r to dataset with no CRS.", assume_crs)
+                except Exception as e:
+                    if options.raise_on_error:
+                        raise ExtractError(
+                            f"Failed to set CRS to {assume_crs!r}: {e}"
+                        ) from e
+                    logger.warning("Failed to set CRS to %r: %s", assume_crs, e)
+            else:
+                logger.info(
+                    "CRS already present (%s); 'assume_crs' hint ignored.", gdf.crs
+                )
+
+        # DXF sources commonly lack a CRS; warn once up front rather than
+        # letting every downstream write repeat the complaint.
         if gdf.crs is None:
-            try:
-                gdf = gdf.set_crs(assume_crs, allow_override=True)
-                logger.info("Assigned CRS %r to dataset with no CRS.", assume_crs)
-            except Exception as e:
-                if options.raise_on_error:
-                    raise ExtractError(
-                        f"Failed to set CRS to {assume_crs!r}: {e}"
-                    ) from e
-                logger.warning("Failed to set CRS to %r: %s", assume_crs, e)
-        else:
-            logger.info("CRS already present (%s); 'assume_crs' hint ignored.", gdf.crs)
-
-    if gdf.empty:
-        if options.raise_on_error:
-            raise ExtractError("No features read from DXF.")
-        logger.warning("No features read from DXF; nothing to write.")
-        return
-
-    # Apply filters
-    gdf = _apply_filters(gdf, options.filter_options)
-    if gdf.empty:
-        if options.raise_on_error:
-            raise ExtractError("No features remaining after filtering.")
-        logger.warning("No features remaining after filtering; nothing to write.")
-        return
+            logger.warning(
+                "Dataset has no CRS; outputs will lack projection information. "
+                "Pass 'assume_crs' to assign one."
+            )
 
-    # Export
-    if options.flatten:
-        _export_flattened_gpkg(gdf, options, logger)
-    else:
-        _export_partitioned(gdf, options, logger)
+        if gdf.empty:
+            if options.raise_on_error:
+                raise ExtractError("No features read from DXF.")
+            logger.warning("No features read from DXF; nothing to write.")
+            return
+
+        # Partitioned outputs only contain the requested types, so drop the
+        # rest before filtering rather than carrying them through the chain
+        if not options.flatten:
+            gdf = _restrict_to_geometry_types(gdf, options.geometry_types)
+
+        # Apply filters; _read_dxf has already pushed any bbox into the read
+        gdf = _apply_filters(gdf, options.filter_options, bbox_prefiltered=True)
+        if gdf.empty:
+            if options.raise_on_error:
+                raise ExtractError("No features remaining after filtering.")
+            logger.warning("No features remaining after filtering; nothing to write.")
+            return
+
+        # Export
+        with _tuned_gdal_config():
+            if options.flatten:
+                _export_flattened_gpkg(gdf, options, logger)
+            else:
+                _export_partitioned(gdf, options, logger)
+    finally:
+        _flush_logging(logger)
 
 
 # ---- Private helpers ----
 
 
 # Setup / IO helpers
+@contextmanager
+def _gdal_config(options: dict[str, str]):
+    """
+    Apply GDAL config options for a scope, restoring previous values on exit.
+    """
+    previous = {key: get_gdal_config_option(key) for key in options}
+    set_gdal_config_options(options)
+    try:
+        yield
+    finally:
+        set_gdal_config_options(previous)
+
+
+def _gpkg_bulk_write_config():
+    """
+    Relax SQLite durability settings for the duration of a GPKG bulk write.
+
+    Pyogrio already batches feature writes into transactions; the remaining
+    per-commit cost on GPKG is fsync and journal traffic, which these options
+    avoid.
+    """
+    return _gdal_config(
+        {"OGR_SQLITE_SYNCHRONOUS": "OFF", "OGR_SQLITE_JOURNAL": "MEMORY"}
+    )
+
+
+def _tuned_gdal_config():
+    """
+    Raise GDAL's conservative default cache limits for an extraction run.
+
+    GDAL_CACHEMAX and OGR_SQLITE_CACHE are in megabytes; the defaults are
+    sized for small workloads and throttle both the DXF read and SQLite-
+    backed writes on large files.
+    """
+    return _gdal_config({"GDAL_CACHEMAX": "512", "OGR_SQLITE_CACHE": "512"})
+
+
+def _compile_patterns(
+    patterns: tuple[str | re.Pattern[str], ...],
+) -> list[re.Pattern[str]]:
+    """
+    Compile layer patterns, passing pre-compiled ones through unchanged.
+
+    Strings are compiled with ``re.IGNORECASE``; ``re.Pattern`` objects are
+    used exactly as compiled, so the caller's flags apply. Patterns are kept
+    separate rather than OR-joined into one source string, because global
+    inline flags such as ``(?i)`` are only legal at the start of an
+    expression and would break on concatenation.
+    """
+    return [p if isinstance(p, re.Pattern) else re.compile(p, re.I) for p in patterns]
+
+
+def _match_any(names: pd.Series, patterns: tuple[str | re.Pattern[str], ...]):
+    """Boolean mask of rows in ``names`` matching at least one pattern."""
+    mask = None
+    for pat in _compile_patterns(patterns):
+        hit = names.str.contains(pat, na=False)
+        mask = hit if mask is None else (mask | hit)
+    return mask
+
+
+def _sql_quote(value: str) -> str:
+    """Quote a string literal for use in an OGR SQL WHERE clause."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _build_read_where(fo: FilterOptions | None) -> str | None:
+    """
+    Build an OGR SQL WHERE clause approximating the configured filters.
+
+    The clause is pushed into the read via Pyogrio so that GDAL discards
+    non-matching features before they reach Python. It is deliberately a
+    coarse pre-filter: it must never drop a feature that `_apply_filters`
+    would keep, so include filters are only pushed when they cannot
+    under-select (``ILIKE`` is case-insensitive and its wildcards can only
+    widen a match), and exclude filters are only pushed for names free of
+    ``LIKE`` wildcard characters. The exact semantics are re-applied in
+    `_apply_filters` afterwards.
+    """
+    if fo is None:
+        return None
+
+    clauses: list[str] = []
+
+    # Includes can only be pushed when exact names are the sole inclusion
+    # criterion; regex patterns cannot be expressed in OGR SQL.
+    if fo.include_layers and not fo.include_layer_patterns:
+        alts = " OR ".join(
+            f'"Layer" ILIKE {_sql_quote(name)}' for name in fo.include_layers
+        )
+        clauses.append(f"({alts})")
+
+    # Excludes must not over-exclude: skip names containing LIKE wildcards,
+    # and keep NULL layer values for the Python-side filter to judge.
+    safe_excludes = [
+        name
+        for name in (fo.exclude_layers or ())
+        if "%" not in name and "_" not in name
+    ]
+    for name in safe_excludes:
+        clauses.append(f'("Layer" NOT ILIKE {_sql_quote(name)} OR "Layer" IS NULL)')
+
+    # Field-value exclusions are deliberately NOT pushed down: OGR SQL
+    # string comparison is case-insensitive, so "Layer" NOT IN ('ROADS')
+    # would also drop 'roads' rows that the case-sensitive pandas isin
+    # keeps. Exact semantics are applied in `_apply_filters` only.
+
+    return " AND ".join(clauses) if clauses else None
+
+
 def _configure_logging(
     log_path: Path, *, console_level: int | None = logging.INFO
 ) -> None:
     """
     Configure logging to both file and console.
+
+    File output is buffered: the log file opens lazily and records are held
+    in memory (flushed on error, buffer overflow, or `_flush_logging`) so
+    routine logging stays off the export hot path.
     """
     logger = logging.getLogger("dxf2geo.extract")
     logger.setLevel(logging.DEBUG)
+    for handler in logger.handlers:
+        handler.close()
     logger.handlers.clear()
 
-    file_h = logging.FileHandler(log_path, encoding="utf-8")
+    file_h = logging.FileHandler(log_path, encoding="utf-8", delay=True)
     file_h.setLevel(logging.DEBUG)
     file_h.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
-    logger.addHandler(file_h)
+    buffered_h = logging.handlers.MemoryHandler(
+        capacity=1000, flushLevel=logging.ERROR, target=file_h
+    )
+    logger.addHandler(buffered_h)
 
     if console_level is not None:
         console_h = logging.StreamHandler()
@@ -253,14 +412,39 @@ def _configure_logging(
         logger.addHandler(console_h)
 
 
+def _flush_logging(logger: logging.Logger) -> None:
+    """
+    Flush buffered log records through to the log file.
+    """
+    for handler in logger.handlers:
+        handler.flush()
+
+
 def _read_dxf(dxf_path: Path, fo: FilterOptions | None) -> gpd.GeoDataFrame:
     """
-    Read DXF into a GeoDataFrame, applying bbox early when provided.
+    Read DXF into a GeoDataFrame, pushing bbox and coarse attribute filters
+    into the read when provided.
     """
     kwargs = {"engine": "pyogrio"}
+    if _HAVE_PYARROW:
+        # Batch transfer via GDAL's Arrow stream instead of per-feature
+        # conversion; Pyogrio falls back internally if the driver lacks it.
+        kwargs["use_arrow"] = True
     if fo and fo.bbox:
         kwargs["bbox"] = fo.bbox
-    gdf = gpd.read_file(dxf_path, **kwargs)
+    where = _build_read_where(fo)
+    if where is not None:
+        try:
+            gdf = gpd.read_file(dxf_path, where=where, **kwargs)
+        except Exception:
+            # Some drivers reject attribute filters; fall back to an
+            # unfiltered read and rely on the Python-side filters.
+            logging.getLogger("dxf2geo.extract").debug(
+                "Attribute filter pushdown failed (%r); reading unfiltered.", where
+            )
+            gdf = gpd.read_file(dxf_path, **kwargs)
+    else:
+        gdf = gpd.read_file(dxf_path, **kwargs)
     # Ensure a geometry column exists and drop obviously invalid rows
     if "geometry" not in gdf.columns:
         gdf = gpd.GeoDataFrame(gdf, geometry=None, crs=None)
@@ -268,11 +452,49 @@ def _read_dxf(dxf_path: Path, fo: FilterOptions | None) -> gpd.GeoDataFrame:
 
 
 # Filtering helpers
-def _apply_filters(gdf: gpd.GeoDataFrame, fo: FilterOptions | None) -> gpd.GeoDataFrame:
+@lru_cache(maxsize=32)
+def _lower_set(names: tuple[str, ...] | None) -> frozenset[str]:
     """
-    Apply layer/regex, emptiness, size, bbox (defensive), and field value filters.
+    Lower-cased frozenset of layer names, memoised per filter tuple.
+
+    FilterOptions stores names as tuples, so repeated runs with the same
+    options reuse the normalised set instead of re-lowercasing per call.
     """
-    if fo is None:
+    return frozenset(name.lower() for name in (names or ()))
+
+
+def _filters_active(fo: FilterOptions) -> bool:
+    """True if any filter in ``fo`` can actually drop a feature."""
+    return bool(
+        fo.include_layers
+        or fo.exclude_layers
+        or fo.include_layer_patterns
+        or fo.exclude_layer_patterns
+        or fo.drop_empty
+        or fo.drop_zero_geom
+        or fo.min_area is not None
+        or fo.min_length is not None
+        or fo.bbox
+        or fo.exclude_field_values
+    )
+
+
+def _apply_filters(
+    gdf: gpd.GeoDataFrame,
+    fo: FilterOptions | None,
+    *,
+    bbox_prefiltered: bool = False,
+) -> gpd.GeoDataFrame:
+    """
+    Apply layer/regex, field value, bbox (defensive), emptiness, and size
+    filters, in roughly ascending cost order: attribute scans run first so
+    the per-geometry measurements at the end see the fewest features.
+
+    When ``bbox_prefiltered`` is true the caller guarantees the bbox was
+    already applied during the read, so the envelope re-check (a full
+    bounds computation per feature) is skipped.
+    """
+    if fo is None or not _filters_active(fo):
         return gdf
 
     out = gdf
@@ -280,25 +502,55 @@ def _apply_filters(gdf: gpd.GeoDataFrame, fo: FilterOptions | None) -> gpd.GeoDa
     # Layer name filtering (exact, case-insensitive; and regex on raw values)
     layer_series = out.get("Layer")
     if layer_series is not None:
+        # Compute the string views once; each astype/lower pass allocates a
+        # full column, so avoid repeating them per filter below.
+        layer_names = layer_series.astype(str)
+        layer_lower = layer_names.str.lower()
+
         # Inclusion gate
-        inc_names = set(map(str.lower, fo.include_layers or ()))
-        inc_pats = [re.compile(p, re.I) for p in (fo.include_layer_patterns or ())]
+        inc_names = _lower_set(fo.include_layers)
+        inc_pats = fo.include_layer_patterns or ()
         if inc_names or inc_pats:
-            mask_name = layer_series.astype(str).str.lower().isin(inc_names)
+            mask_name = layer_lower.isin(inc_names)
             mask_pat = False
             if inc_pats:
-                # Combine with OR across patterns
-                pat = re.compile("|".join(p.pattern for p in inc_pats), re.I)
-                mask_pat = layer_series.astype(str).str.contains(pat, na=False)
-            out = out[mask_name | mask_pat]
+                mask_pat = _match_any(layer_names, inc_pats)
+            keep = mask_name | mask_pat
+            # Slice the cached series alongside the frame so later masks
+            # stay index-aligned without a pandas reindex per filter.
+            out = out[keep]
+            layer_names = layer_names[keep]
+            layer_lower = layer_lower[keep]
 
         # Exclusion veto
-        exc_names = set(map(str.lower, fo.exclude_layers or ()))
+        exc_names = _lower_set(fo.exclude_layers)
         if exc_names:
-            out = out[~layer_series.astype(str).str.lower().isin(exc_names)]
+            keep = ~layer_lower.isin(exc_names)
+            out = out[keep]
+            layer_names = layer_names[keep]
         if fo.exclude_layer_patterns:
-            pat_exc = re.compile("|".join(fo.exclude_layer_patterns), re.I)
-            out = out[~layer_series.astype(str).str.contains(pat_exc, na=False)]
+            out = out[~_match_any(layer_names, fo.exclude_layer_patterns)]
+
+    # Field value exclusions (cheap column scans, before any geometry work)
+    if fo.exclude_field_values:
+        tmp = out
+        for col, disallowed in fo.exclude_field_values.items():
+            if col in tmp.columns:
+                tmp = tmp[~tmp[col].isin(disallowed)]
+        out = tmp
+
+    # Defensive bbox post-filter (Pyogrio already applied on read if provided)
+    if fo.bbox and not bbox_prefiltered:
+        minx, miny, maxx, maxy = fo.bbox
+        # envelope intersects box
+        bounds = out.geometry.bounds  # DataFrame: minx, miny, maxx, maxy
+        mask_bbox = (
+            (bounds["maxx"] >= minx)
+            & (bounds["minx"] <= maxx)
+            & (bounds["maxy"] >= miny)
+            & (bounds["miny"] <= maxy)
+        )
+        out = out[mask_bbox]
 
     # Drop empties
     if fo.drop_empty:
@@ -306,42 +558,25 @@ def _apply_filters(gdf: gpd.GeoDataFrame, fo: FilterOptions | None) -> gpd.GeoDa
 
     # Zero-size / min thresholds
     # Note: area() is meaningful for areal geometries; length for linear.
+    # Each metric is computed once and the thresholds combined into a
+    # single mask, rather than re-measuring every geometry per threshold.
     if fo.drop_zero_geom or fo.min_area is not None:
         # For polygons only
         is_poly = out.geom_type.str.contains("POLYGON", case=False, na=False)
+        area = out.geometry.area
+        keep_poly = area > 0.0 if fo.drop_zero_geom else True
         if fo.min_area is not None:
-            out = out[~is_poly | (out.geometry.area >= float(fo.min_area))]
-        if fo.drop_zero_geom:
-            out = out[~is_poly | (out.geometry.area > 0.0)]
+            keep_poly = keep_poly & (area >= float(fo.min_area))
+        out = out[~is_poly | keep_poly]
 
     if fo.drop_zero_geom or fo.min_length is not None:
         # For lineal geometries only
         is_line = out.geom_type.str.contains("LINE", case=False, na=False)
+        length = out.geometry.length
+        keep_line = length > 0.0 if fo.drop_zero_geom else True
         if fo.min_length is not None:
-            out = out[~is_line | (out.geometry.length >= float(fo.min_length))]
-        if fo.drop_zero_geom:
-            out = out[~is_line | (out.geometry.length > 0.0)]
-
-    # Defensive bbox post-filter (Pyogrio already applied on read if provided)
-    if fo.bbox:
-        minx, miny, maxx, maxy = fo.bbox
-        # envelope intersects box
-        bounds = out.geometry.bounds  # DataFrame: minx, miny, maxx, maxy
-        mask_bbox = (
-            (bounds["maxx"] >= minx)
-            & (bounds["minx"] <= maxx)
-            & (bounds["maxy"] >= miny)
-            & (bounds["miny"] <= maxy)
-        )
-        out = out[mask_bbox]
-
-    # Field value exclusions
-    if fo.exclude_field_values:
-        tmp = out
-        for col, disallowed in fo.exclude_field_values.items():
-            if col in tmp.columns:
-                tmp = tmp[~tmp[col].isin(disallowed)]
-        out = tmp
+            keep_line = keep_line & (length >= float(fo.min_length))
+        out = out[~is_line | keep_line]
 
     return out
 
@@ -349,6 +584,16 @@ def _apply_filters(gdf: gpd.GeoDataFrame, fo: FilterOptions | None) -> gpd.GeoDa
 # Export helpers
 _GEOMS_CANON = ("POINT", "LINESTRING", "POLYGON", "MULTILINESTRING", "MULTIPOLYGON")
 
+# Integer WKB-style type ids (shapely.get_type_id) to canonical names
+_GEOM_TYPE_ID_TO_NAME = {
+    int(shapely.GeometryType.POINT): "POINT",
+    int(shapely.GeometryType.LINESTRING): "LINESTRING",
+    int(shapely.GeometryType.POLYGON): "POLYGON",
+    int(shapely.GeometryType.MULTIPOINT): "MULTIPOINT",
+    int(shapely.GeometryType.MULTILINESTRING): "MULTILINESTRING",
+    int(shapely.GeometryType.MULTIPOLYGON): "MULTIPOLYGON",
+}
+
 
 def _export_flattened_gpkg(
     gdf: gpd.GeoDataFrame, options: ExtractOptions, logger: logging.Logger
@@ -362,9 +607,10 @@ def _export_flattened_gpkg(
     logger.info("Exporting all geometries to %s", output_path)
 
     try:
-        gdf.to_file(
-            output_path, layer="all_geometries", driver="GPKG", engine="pyogrio"
-        )
+        with _gpkg_bulk_write_config():
+            gdf.to_file(
+                output_path, layer="all_geometries", driver="GPKG", engine="pyogrio"
+            )
     except Exception as e:
         raise OutputCreateError(f"Failed to write flattened GPKG: {e}") from e
 
@@ -385,55 +631,135 @@ def _export_partitioned(
     # Keep order and only those we know how to detect
     requested = tuple(n for n in requested if n in _GEOMS_CANON)
 
-    for geometry_name in tqdm(
-        requested,
-        desc="Iterating over geometries",
-        dynamic_ncols=True,
-        leave=True,
-        mininterval=0.2,
-    ):
-        part = _filter_by_geom_name(gdf, geometry_name)
-        if part.empty:
-            continue
+    # Partition once rather than re-scanning the full frame per type
+    parts = _partition_by_geom_type(gdf, requested)
 
-        if is_shapefile:
-            # One folder per type, one shapefile per folder
-            out_dir = options.output_root / geometry_name.lower()
-            out_dir.mkdir(parents=True, exist_ok=True)
-            output_path = out_dir / f"{geometry_name.lower()}.shp"
-            layer_kw = dict()
-            # Shapefile field-name constraints
-            part_to_write = _apply_shapefile_field_rules(part)
-        else:
-            # One GPKG file per type, layer name is the type
-            output_path = options.output_root / f"{geometry_name.lower()}.gpkg"
-            layer_kw = dict(layer=geometry_name.lower())
-            part_to_write = part
+    write_config = nullcontext() if is_shapefile else _gpkg_bulk_write_config()
+    with write_config:
+        _write_partitions(parts, requested, options, is_shapefile)
 
-        _prepare_output_path(output_path, is_shapefile=is_shapefile)
-        try:
-            part_to_write.to_file(
-                output_path,
-                driver=("ESRI Shapefile" if is_shapefile else "GPKG"),
-                engine="pyogrio",
-                **layer_kw,
+
+def _write_partitions(
+    parts: dict[str, gpd.GeoDataFrame],
+    requested: tuple[str, ...],
+    options: ExtractOptions,
+    is_shapefile: bool,
+) -> None:
+    """
+    Write per-type partitions to their output files or layers.
+
+    Each type writes to an independent file, so non-trivial exports fan out
+    over a thread pool; Pyogrio releases the GIL for the underlying GDAL
+    work, giving concurrent per-type writes without copying the frames.
+    """
+    names = [n for n in requested if n in parts and not parts[n].empty]
+    if not names:
+        return
+
+    if len(names) == 1:
+        _write_one_partition(names[0], parts[names[0]], options, is_shapefile)
+        return
+
+    max_workers = min(len(names), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                _write_one_partition, name, parts[name], options, is_shapefile
             )
-        except Exception as e:
-            raise OutputCreateError(f"Failed to write '{geometry_name}': {e}") from e
+            for name in names
+        ]
+        for future in tqdm(
+            as_completed(futures),
+            total=len(futures),
+            desc="Iterating over geometries",
+            dynamic_ncols=True,
+            leave=True,
+            mininterval=1.0,
+            smoothing=0,
+            # Skip the terminal refresh path entirely in batch/CI runs
+            disable=not sys.stderr.isatty(),
+        ):
+            future.result()
+
+
+def _write_one_partition(
+    geometry_name: str,
+    part: gpd.GeoDataFrame,
+    options: ExtractOptions,
+    is_shapefile: bool,
+) -> None:
+    """
+    Write a single geometry-type partition to its output file or layer.
+    """
+    if is_shapefile:
+        # One folder per type, one shapefile per folder
+        out_dir = options.output_root / geometry_name.lower()
+        out_dir.mkdir(parents=True, exist_ok=True)
+        output_path = out_dir / f"{geometry_name.lower()}.shp"
+        layer_kw = dict()
+        # Shapefile field-name constraints
+        part_to_write = _apply_shapefile_field_rules(part)
+    else:
+        # One GPKG file per type, layer name is the type
+        output_path = options.output_root / f"{geometry_name.lower()}.gpkg"
+        layer_kw = dict(layer=geometry_name.lower())
+        part_to_write = part
 
-        if options.raise_on_error and part_to_write.empty:
-            raise ExtractError(f"No features written for '{geometry_name}'.")
+    _prepare_output_path(output_path, is_shapefile=is_shapefile)
+    try:
+        part_to_write.to_file(
+            output_path,
+            driver=options.driver_name,
+            engine="pyogrio",
+            **layer_kw,
+        )
+    except Exception as e:
+        raise OutputCreateError(f"Failed to write '{geometry_name}': {e}") from e
 
+    if options.raise_on_error and part_to_write.empty:
+        raise ExtractError(f"No features written for '{geometry_name}'.")
 
-def _filter_by_geom_name(gdf: gpd.GeoDataFrame, target: str) -> gpd.GeoDataFrame:
+
+def _restrict_to_geometry_types(
+    gdf: gpd.GeoDataFrame, geometry_types: tuple[str, ...]
+) -> gpd.GeoDataFrame:
     """
-    Return subset of gdf whose geometry type matches target (case-insensitive).
+    Drop features whose geometry type was not requested.
+
+    Applied straight after the read so the filter chain and export only
+    ever touch features that can appear in an output.
     """
-    # GeoPandas/Shapely report geometry types like 'LineString', 'MultiPolygon'
-    mask = gdf.geom_type.str.upper() == target.upper()
+    wanted_names = {n.upper() for n in geometry_types} & set(_GEOMS_CANON)
+    wanted_ids = [
+        tid for tid, name in _GEOM_TYPE_ID_TO_NAME.items() if name in wanted_names
+    ]
+    type_ids = shapely.get_type_id(gdf.geometry.values)
+    mask = np.isin(type_ids, wanted_ids)
+    if mask.all():
+        return gdf
     return gdf[mask]
 
 
+def _partition_by_geom_type(
+    gdf: gpd.GeoDataFrame, requested: tuple[str, ...]
+) -> dict[str, gpd.GeoDataFrame]:
+    """
+    Split gdf into per-geometry-type frames in a single pass.
+
+    Grouping on shapely's integer type ids touches each feature once and
+    avoids building a per-feature type-name string column; missing
+    geometries (type id -1) fall outside the mapping and are dropped.
+    """
+    wanted = set(requested)
+    type_ids = shapely.get_type_id(gdf.geometry.values)
+    parts: dict[str, gpd.GeoDataFrame] = {}
+    for type_id, part in gdf.groupby(type_ids, sort=False):
+        name = _GEOM_TYPE_ID_TO_NAME.get(type_id)
+        if name in wanted:
+            parts[name] = part
+    return parts
+
+
 def _prepare_output_path(output_path: Path, *, is_shapefile: bool) -> None:
     """
     Remove existing outputs to emulate ogr2ogr overwrite semantics.
@@ -449,40 +775,57 @@ def _prepare_output_path(output_path: Path, *, is_shapefile: bool) -> None:
 
 
 # Field/Schema helpers for Shapefile
+_FIELD_NAME_RE = re.compile(r"[^A-Za-z0-9_]")
+
+
 def _normalise_field_name(name: str) -> str:
     """Alphanumeric/underscore only; conservative for cross-compat."""
-    return re.sub(r"[^A-Za-z0-9_]", "_", name)
+    return _FIELD_NAME_RE.sub("_", name)
 
 
-def _make_shapefile_field_names(source_names: list[str]) -> list[str]:
+@lru_cache(maxsize=16)
+def _make_shapefile_field_names(source_names: tuple[str, ...]) -> tuple[str, ...]:
     """
     Create valid, unique field names for Shapefiles from source field names.
     Ensures names are uppercase, ≤10 characters, and unique.
+
+    Memoised on the source-name tuple: partitioned exports sanitise the
+    same schema once per geometry type otherwise.
     """
-    used = set()
+    used: set[str] = set()
+    # Next suffix to try per truncated base, so probing for the n-th
+    # duplicate resumes where the previous one stopped instead of
+    # rescanning suffixes from 1 (quadratic for many near-duplicates).
+    counters: dict[str, int] = {}
     result: list[str] = []
     for raw in source_names:
         base = _normalise_field_name(raw) or "F"
-        base10 = base[:10]
-        candidate = base10.upper()
-        i = 1
-        while candidate in used or candidate == "":
-            suffix = f"_{i}"
-            candidate = (base10[: max(0, 10 - len(suffix))] + suffix).upper()
-            i += 1
+        # Normalise case once; suffix probing below only slices this value
+        base10 = base[:10].upper()
+        candidate = base10
+        if candidate == "" or candidate in used:
+            i = counters.get(base10, 0)
+            while candidate == "" or candidate in used:
+                i += 1
+                suffix = f"_{i}"
+                candidate = base10[: max(0, 10 - len(suffix))] + suffix
+            counters[base10] = i
         used.add(candidate)
         result.append(candidate)
-    return result
+    return tuple(result)
 
 
 def _apply_shapefile_field_rules(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     """
-    Return a copy of gdf with columns renamed to satisfy Shapefile constraints.
+    Return gdf with columns renamed to satisfy Shapefile constraints.
     Geometry column is preserved.
+
+    Only the column labels change, so the returned frame shares its data
+    (geometry included) with the input rather than deep-copying it.
     """
     cols = [c for c in gdf.columns if c != gdf.geometry.name]
-    new_cols = _make_shapefile_field_names(cols)
+    new_cols = _make_shapefile_field_names(tuple(cols))
     rename_map = dict(zip(cols, new_cols, strict=False))
     if not rename_map:
         return gdf
-    return gdf.rename(columns=rename_map, copy=True)
+    return gdf.rename(columns=rename_map)
@@ -21,12 +21,25 @@ Notes
 """
 
 from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
+import plotly.io as pio
 from pyogrio import list_layers
+import shapely
+
+try:
+    # Serialise figures with orjson when available: typed-array encoding of
+    # the coordinate arrays is several times faster than the stdlib engine.
+    import orjson  # noqa: F401
+
+    pio.json.config.default_engine = "orjson"
+except ImportError:
+    pass
 
 
 def _normalise_geom_labels(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
@@ -36,15 +49,17 @@ def _normalise_geom_labels(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     Parameters
     ----------
     gdf : geopandas.GeoDataFrame
-        Input frame with a ``geometry`` column.
+        Input frame with a ``geometry`` column. Modified in place: callers
+        always pass a frame freshly constructed by ``gpd.read_file``, so
+        copying the whole frame just to add one column would be wasted
+        allocation.
 
     Returns
     -------
     geopandas.GeoDataFrame
-        Copy of ``gdf`` with a new ``geometry_type`` column containing
-        upper-case geometry type names (e.g., ``'LINESTRING'``).
+        ``gdf`` with a new ``geometry_type`` column containing upper-case
+        geometry type names (e.g., ``'LINESTRING'``).
     """
-    gdf = gdf.copy()
     gdf["geometry_type"] = gdf.geom_type.str.upper()
     return gdf
 
@@ -145,16 +160,30 @@ def _load_from_shapefile_dir(
     -------
     list of geopandas.GeoDataFrame
         Frames for each found type; missing types are ignored.
+
+    Notes
+    -----
+    Reads run concurrently on a thread pool: Pyogrio releases the GIL for
+    the underlying GDAL work, so independent files load in parallel.
+    Result order follows ``geometry_types``.
     """
-    gdfs: list[gpd.GeoDataFrame] = []
-    for gtype in geometry_types:
-        shp_path = root / gtype.lower() / f"{gtype.lower()}.shp"
-        if shp_path.exists():
-            gdf = gpd.read_file(shp_path, engine="pyogrio")
-            gdf["geometry_type"] = gtype  # explicit for plotting
-            gdf["__source__"] = shp_path.stem
-            gdfs.append(gdf)
-    return gdfs
+    found = [
+        (gtype, root / gtype.lower() / f"{gtype.lower()}.shp")
+        for gtype in geometry_types
+        if (root / gtype.lower() / f"{gtype.lower()}.shp").exists()
+    ]
+
+    def _read(item: tuple[str, Path]) -> gpd.GeoDataFrame:
+        gtype, shp_path = item
+        gdf = gpd.read_file(shp_path, engine="pyogrio")
+        gdf["geometry_type"] = gtype  # explicit for plotting
+        gdf["__source__"] = shp_path.stem
+        return gdf
+
+    if len(found) <= 1:
+        return [_read(item) for item in found]
+    with ThreadPoolExecutor(max_workers=min(8, len(found))) as executor:
+        return list(executor.map(_read, found))
 
 
 def _load_from_gpkg_dir(
@@ -177,13 +206,24 @@ def _load_from_gpkg_dir(
     -------
     list of geopandas.GeoDataFrame
         Frames for all spatial layers found in the per-type GeoPackages.
+
+    Notes
+    -----
+    Per-type files are read concurrently on a thread pool, mirroring
+    :func:`_load_from_shapefile_dir`. Result order follows
+    ``geometry_types``.
     """
-    gdfs: list[gpd.GeoDataFrame] = []
-    for gtype in geometry_types:
-        gpkg_path = root / f"{gtype.lower()}.gpkg"
-        if gpkg_path.exists():
-            gdfs.extend(_read_gpkg_all_layers(gpkg_path))
-    return gdfs
+    paths = [
+        root / f"{gtype.lower()}.gpkg"
+        for gtype in geometry_types
+        if (root / f"{gtype.lower()}.gpkg").exists()
+    ]
+    if len(paths) <= 1:
+        per_file = [_read_gpkg_all_layers(p) for p in paths]
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+            per_file = list(executor.map(_read_gpkg_all_layers, paths))
+    return [gdf for gdfs in per_file for gdf in gdfs]
 
 
 def _fallback_scan_top_level(root: Path) -> list[gpd.GeoDataFrame]:
@@ -208,6 +248,30 @@ def _fallback_scan_top_level(root: Path) -> list[gpd.GeoDataFrame]:
     return gdfs
 
 
+def _categorise_helper_columns(gdfs: list[gpd.GeoDataFrame]) -> None:
+    """
+    Cast the helper label columns to a shared categorical dtype, in place.
+
+    ``geometry_type`` and ``__source__`` hold a handful of distinct strings
+    repeated once per feature, so as plain object columns the final concat
+    copies a Python string reference per row. A categorical over the union
+    of values across layers stores integer codes instead, and ``pd.concat``
+    keeps the dtype because every frame shares it.
+
+    Parameters
+    ----------
+    gdfs : list of geopandas.GeoDataFrame
+        Frames about to be concatenated; modified in place.
+    """
+    for col in ("geometry_type", "__source__"):
+        if not all(col in g.columns for g in gdfs):
+            continue
+        categories = sorted({v for g in gdfs for v in g[col].unique() if pd.notna(v)})
+        dtype = pd.CategoricalDtype(categories)
+        for g in gdfs:
+            g[col] = g[col].astype(dtype)
+
+
 def _coords_to_xy(seq: Sequence[Sequence[float]]) -> tuple[list[float], list[float]]:
     """
     Split a coordinate sequence into separate X and Y lists.
@@ -222,11 +286,83 @@ def _coords_to_xy(seq: Sequence[Sequence[float]]) -> tuple[list[float], list[flo
     (list of float, list of float)
         Two lists: ``(xs, ys)``.
     """
-    xs, ys = [], []
-    for c in seq:
-        xs.append(c[0])
-        ys.append(c[1])
-    return xs, ys
+    arr = np.asarray(seq)
+    if arr.size == 0:
+        return [], []
+    return arr[:, 0].tolist(), arr[:, 1].tolist()
+
+
+def _nan_separated_traces(
+    parts: np.ndarray, part_src: np.ndarray, labels: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, list[str]]:
+    """
+    Flatten line-like parts into NaN-separated Plotly trace arrays.
+
+    Plotly treats NaN coordinates as line breaks, so a whole layer can be
+    drawn as a single trace. All coordinate extraction happens in Shapely's
+    C layer; no per-feature Python iteration.
+
+    Parameters
+    ----------
+    parts : numpy.ndarray
+        Line-like geometries (linestrings or rings), e.g. the output of
+        :func:`shapely.get_parts`.
+    part_src : numpy.ndarray
+        For each part, the positional index of the source feature it came
+        from (as returned by ``shapely.get_parts(..., return_index=True)``).
+    labels : numpy.ndarray
+        Hover label per source feature, positionally indexed.
+
+    Returns
+    -------
+    (numpy.ndarray, numpy.ndarray, list of str)
+        X and Y arrays with a NaN break after each part, and the matching
+        per-vertex hover labels.
+    """
+    coords, vertex_part = shapely.get_coordinates(parts, return_index=True)
+    counts = np.bincount(vertex_part, minlength=len(parts))
+    xs = np.full(coords.shape[0] + len(parts), np.nan)
+    ys = np.full_like(xs, np.nan)
+    # Each vertex lands one slot further right per NaN break before it,
+    # and the number of preceding breaks is exactly its part index.
+    pos = np.arange(coords.shape[0]) + vertex_part
+    xs[pos] = coords[:, 0]
+    ys[pos] = coords[:, 1]
+    hover = np.repeat(labels[part_src], counts + 1).tolist()
+    return xs, ys, hover
+
+
+_HOVER_EXCLUDE = ("geometry", "geometry_type", "__source__")
+
+
+def _hover_series(layer: gpd.GeoDataFrame) -> pd.Series:
+    """
+    Build hover labels for a whole layer in one vectorised pass.
+
+    Equivalent to applying :func:`format_hovertext` row by row, but uses
+    columnwise pandas string operations instead of per-row Python iteration.
+
+    Parameters
+    ----------
+    layer : geopandas.GeoDataFrame
+        Features whose non-geometry attributes should be rendered.
+
+    Returns
+    -------
+    pandas.Series
+        Hover string per row, aligned to ``layer.index``. Rows with no
+        non-null attributes map to ``' '``.
+    """
+    cols = [c for c in layer.columns if c not in _HOVER_EXCLUDE]
+    if not cols:
+        return pd.Series(" ", index=layer.index)
+    attrs = layer[cols]
+    pieces = pd.DataFrame(
+        {col: col + ": " + attrs[col].astype(str) for col in cols},
+        index=layer.index,
+    ).where(attrs.notna())
+    joined = pieces.stack().dropna().groupby(level=0).agg("<br>".join)
+    return joined.reindex(layer.index, fill_value=" ")
 
 
 def format_hovertext(row_entry: pd.Series) -> str:
@@ -322,6 +458,8 @@ def load_geometries(
         raise RuntimeError(f"No geometries loaded from {input_path}")
 
     crs = next((g.crs for g in gdfs if g.crs is not None), None)
+    if len(gdfs) > 1:
+        _categorise_helper_columns(gdfs)
     gdf = gpd.GeoDataFrame(pd.concat(gdfs, ignore_index=True), crs=crs)
     return gdf
 
@@ -343,10 +481,64 @@ def filter_modelspace_lines(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     geopandas.GeoDataFrame
         Subset of ``gdf`` where ``PaperSpace != 1``.
     """
-    paper_space_indicator = 1.0
-    paper = gdf.get("PaperSpace", pd.Series(0, index=gdf.index))
-    paper = pd.to_numeric(paper, errors="coerce").fillna(0).astype(int)
-    return gdf.loc[paper != int(bool(paper_space_indicator))]
+    paper_space_indicator = 1
+    paper = gdf.get("PaperSpace")
+    if paper is None:
+        return gdf
+    if not pd.api.types.is_numeric_dtype(paper):
+        paper = pd.to_numeric(paper, errors="coerce")
+    # NaN != 1 is True, so unparseable/missing markers are kept, matching
+    # the previous fillna(0) behaviour without the extra allocations.
+    keep = (paper != paper_space_indicator).to_numpy()
+    return gdf.iloc[np.flatnonzero(keep)]
+
+
+def remove_short_axis_aligned_lines(
+    gdf: gpd.GeoDataFrame, max_length: float = 1.0, tol: float = 1e-9
+) -> gpd.GeoDataFrame:
+    """
+    Drop short axis-aligned linestrings, such as CAD tick marks and hatching.
+
+    A feature is removed when it is a ``LINESTRING`` whose endpoints differ
+    along exactly one axis (within ``tol``) and whose length is below
+    ``max_length``. All other features are kept unchanged.
+
+    Parameters
+    ----------
+    gdf : geopandas.GeoDataFrame
+        Input features.
+    max_length : float, optional
+        Length below which axis-aligned lines are discarded. Defaults to 1.
+    tol : float, optional
+        Coordinate tolerance for treating an endpoint delta as zero.
+
+    Returns
+    -------
+    geopandas.GeoDataFrame
+        Subset of ``gdf`` without the short axis-aligned lines.
+
+    Notes
+    -----
+    Endpoints, lengths and type checks all come from Shapely 2.0 bulk
+    functions, so the predicate evaluates without per-feature Python calls.
+    """
+    geoms = gdf.geometry.values
+    is_line = (shapely.get_type_id(geoms) == shapely.GeometryType.LINESTRING) & (
+        ~shapely.is_empty(geoms)
+    )
+    line_pos = np.flatnonzero(is_line)
+    if line_pos.size == 0:
+        return gdf
+    lines = geoms[line_pos]
+    starts = shapely.get_coordinates(shapely.get_point(lines, 0))
+    ends = shapely.get_coordinates(shapely.get_point(lines, -1))
+    dx = np.abs(ends[:, 0] - starts[:, 0])
+    dy = np.abs(ends[:, 1] - starts[:, 1])
+    axis_aligned = ((dx <= tol) & (dy > tol)) | ((dy <= tol) & (dx > tol))
+    short = shapely.length(lines) < max_length
+    keep = np.ones(len(gdf), dtype=bool)
+    keep[line_pos[axis_aligned & short]] = False
+    return gdf.iloc[np.flatnonzero(keep)]
 
 
 def plot_geometries(gdf: gpd.GeoDataFrame, output_html: Path | str) -> None:
@@ -375,24 +567,24 @@ def plot_geometries(gdf: gpd.GeoDataFrame, output_html: Path | str) -> None:
       dependencies light.
     """
     fig = go.Figure()
-    geometry_types = gdf.geometry_type.unique()
 
-    for geom_type in geometry_types:
-        layer = gdf[gdf["geometry_type"] == geom_type]
-        if layer.empty:
-            continue
-        elif geom_type in {"POINT", "MULTIPOINT"}:
-            xs, ys, hover = [], [], []
-            for _, row in layer.iterrows():
-                if geom_type == "POINT":
-                    xs.append(row.geometry.x)
-                    ys.append(row.geometry.y)
-                    hover.append(format_hovertext(row))
-                else:
+    # One C-level partition pass instead of a boolean scan per type;
+    # observed=True skips unused categories when the column is categorical.
+    for geom_type, layer in gdf.groupby("geometry_type", sort=False, observed=True):
+        if geom_type in {"POINT", "MULTIPOINT"}:
+            hover_map = _hover_series(layer)
+            if geom_type == "POINT":
+                xs = layer.geometry.x.tolist()
+                ys = layer.geometry.y.tolist()
+                hover = hover_map.tolist()
+            else:
+                xs, ys, hover = [], [], []
+                for idx, row in layer.iterrows():
+                    label = hover_map[idx]
                     for pt in row.geometry.geoms:
                         xs.append(pt.x)
                         ys.append(pt.y)
-                        hover.append(format_hovertext(row))
+                        hover.append(label)
             fig.add_trace(
                 go.Scatter(
                     x=xs,
@@ -405,18 +597,11 @@ def plot_geometries(gdf: gpd.GeoDataFrame, output_html: Path | str) -> None:
                 )
             )
         elif geom_type in {"LINESTRING", "MULTILINESTRING"}:
-            all_x, all_y, hovertext = [], [], []
-            for _, row in layer.iterrows():
-                segments = (
-                    [row.geometry.coords]
-                    if geom_type == "LINESTRING"
-                    else [line.coords for line in row.geometry.geoms]
-                )
-                for seg in segments:
-                    xs, ys = _coords_to_xy(seg)
-                    all_x.extend(xs + [None])
-                    all_y.extend(ys + [None])
-                    hovertext.extend([format_hovertext(row)] * (len(xs) + 1))
+            labels = _hover_series(layer).to_numpy()
+            parts, part_src = shapely.get_parts(
+                layer.geometry.values, return_index=True
+            )
+            all_x, all_y, hovertext = _nan_separated_traces(parts, part_src, labels)
             fig.add_trace(
                 go.Scatter(
                     x=all_x,
@@ -429,14 +614,12 @@ def plot_geometries(gdf: gpd.GeoDataFrame, output_html: Path | str) -> None:
                 )
             )
         elif geom_type in {"POLYGON", "MULTIPOLYGON"}:
-            all_x, all_y, hovertext = [], [], []
-            for _, row in layer.iterrows():
-                polys = [row.geometry] if geom_type == "POLYGON" else row.geometry.geoms
-                for poly in polys:
-                    xs, ys = _coords_to_xy(poly.exterior.coords)
-                    all_x.extend(xs + [None])
-                    all_y.extend(ys + [None])
-                    hovertext.extend([format_hovertext(row)] * (len(xs) + 1))
+            labels = _hover_series(layer).to_numpy()
+            parts, part_src = shapely.get_parts(
+                layer.geometry.values, return_index=True
+            )
+            rings = shapely.get_exterior_ring(parts)
+            all_x, all_y, hovertext = _nan_separated_traces(rings, part_src, labels)
             fig.add_trace(
                 go.Scatter(
                     x=all_x,
@@ -460,4 +643,6 @@ def plot_geometries(gdf: gpd.GeoDataFrame, output_html: Path | str) -> None:
     )
 
     output_html = Path(output_html)
-    fig.write_html(str(output_html), include_plotlyjs="cdn")
+    # Traces are built from library-validated arrays above, so skip Plotly's
+    # per-attribute validation pass when serialising large figures.
+    fig.write_html(str(output_html), include_plotlyjs="cdn", validate=False)
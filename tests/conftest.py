@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterable
+import functools
 from pathlib import Path
 
 import pytest
@@ -15,13 +16,50 @@ try:
 except ImportError:
     ezdxf = None
 
+try:
+    import geopandas as _gpd  # type: ignore
+
+    # Route every gpd.read_file in the suite through pyogrio, including
+    # call sites that do not pass engine="pyogrio" explicitly.
+    _gpd.options.io_engine = "pyogrio"
+except ImportError:
+    pass
+
+try:
+    import pyarrow  # type: ignore  # noqa: F401
+
+    _HAVE_PYARROW = True
+except ImportError:
+    _HAVE_PYARROW = False
+
 
+def read_any_vector(base: Path):
+    """Read the Shapefile or GeoPackage written next to ``base`` (no suffix).
+
+    Uses pyogrio's Arrow path when pyarrow is installed, which skips the
+    per-row Python conversion layer on readback.
+    """
+    shp = base.with_suffix(".shp")
+    gpkg = base.with_suffix(".gpkg")
+    p = shp if shp.exists() else gpkg
+    assert p.exists(), f"Vector dataset not found next to {base}"
+    if _HAVE_PYARROW:
+        from pyogrio import read_dataframe  # type: ignore
+
+        return read_dataframe(p, use_arrow=True)
+    import geopandas as gpd  # type: ignore
+
+    return gpd.read_file(p, engine="pyogrio")
+
+
+@functools.lru_cache(maxsize=1)
 def have_gdal_dxf_driver() -> bool:
     if ogr is None:
         return False
     return ogr.GetDriverByName("DXF") is not None
 
 
+@functools.lru_cache(maxsize=1)
 def gdal_can_write_dxf() -> bool:
     if not have_gdal_dxf_driver():
         return False
@@ -32,8 +70,20 @@ def gdal_can_write_dxf() -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=1)
+def pyogrio_has_dxf_driver() -> bool:
+    try:
+        from pyogrio import list_drivers  # type: ignore
+    except ImportError:
+        return False
+    return "DXF" in list_drivers()
+
+
+# The pipeline reads DXF through pyogrio, so either provider of GDAL's DXF
+# driver is sufficient; the osgeo bindings are no longer a requirement.
 have_gdal_dxf = pytest.mark.skipif(
-    not have_gdal_dxf_driver(), reason="GDAL not available or DXF driver missing"
+    not (have_gdal_dxf_driver() or pyogrio_has_dxf_driver()),
+    reason="No GDAL DXF driver available (neither osgeo nor pyogrio)",
 )
 
 
@@ -41,32 +91,26 @@ def _create_layer(ds, name: str, geom_type):
     return ds.CreateLayer(name, srs=None, geom_type=geom_type)
 
 
-def _add_point(lyr, x: float, y: float):
-    g = ogr.Geometry(ogr.wkbPoint)
-    g.AddPoint(float(x), float(y))
+def _add_feature(lyr, wkt: str):
+    # One WKT parse per feature instead of per-vertex AddPoint round-trips
+    # through SWIG; SetGeometryDirectly hands ownership over without a copy.
     feat = ogr.Feature(lyr.GetLayerDefn())
-    feat.SetGeometry(g)
+    feat.SetGeometryDirectly(ogr.CreateGeometryFromWkt(wkt))
     lyr.CreateFeature(feat)
 
 
+def _add_point(lyr, x: float, y: float):
+    _add_feature(lyr, f"POINT ({float(x)} {float(y)})")
+
+
 def _add_linestring(lyr, coords: Iterable[tuple[float, float]]):
-    g = ogr.Geometry(ogr.wkbLineString)
-    for x, y in coords:
-        g.AddPoint(float(x), float(y))
-    feat = ogr.Feature(lyr.GetLayerDefn())
-    feat.SetGeometry(g)
-    lyr.CreateFeature(feat)
+    pts = ", ".join(f"{float(x)} {float(y)}" for x, y in coords)
+    _add_feature(lyr, f"LINESTRING ({pts})")
 
 
 def _add_polygon(lyr, ring_coords: Iterable[tuple[float, float]]):
-    ring = ogr.Geometry(ogr.wkbLinearRing)
-    for x, y in ring_coords:
-        ring.AddPoint(float(x), float(y))
-    poly = ogr.Geometry(ogr.wkbPolygon)
-    poly.AddGeometry(ring)
-    feat = ogr.Feature(lyr.GetLayerDefn())
-    feat.SetGeometry(poly)
-    lyr.CreateFeature(feat)
+    pts = ", ".join(f"{float(x)} {float(y)}" for x, y in ring_coords)
+    _add_feature(lyr, f"POLYGON (({pts}))")
 
 
 def write_dxf_with_gdal(
@@ -147,57 +191,146 @@ def write_dxf_with_ezdxf(
     doc.saveas(str(dxf_path))
 
 
+def write_dxf_ascii(
+    dxf_path: Path,
+    *,
+    add_zero_length_line: bool = False,
+    add_far_feature: bool = False,
+    small_poly: bool = False,
+) -> None:
+    """Write the test DXF by assembling its ASCII tag pairs directly.
+
+    The fixture content is tiny and fixed-schema, so emitting the ENTITIES
+    section as text needs no driver at all; GDAL and ezdxf both accept a DXF
+    without a HEADER section. Content matches the driver-based writers:
+    LINE entities on ``roads``/``tmp``, SOLIDs on ``buildings`` (GDAL reads
+    them back as POLYGONs, keeping the min_area path exercised) and a POINT
+    on ``survey_points``.
+    """
+    parts: list[str] = ["0\nSECTION\n2\nENTITIES\n"]
+
+    def _line(layer: str, x1: float, y1: float, x2: float, y2: float) -> None:
+        parts.append(
+            f"0\nLINE\n8\n{layer}\n"
+            f"10\n{x1:.1f}\n20\n{y1:.1f}\n30\n0.0\n"
+            f"11\n{x2:.1f}\n21\n{y2:.1f}\n31\n0.0\n"
+        )
+
+    def _solid(layer: str, coords: Iterable[tuple[float, float]]) -> None:
+        # SOLID corners are emitted in bowtie order (the edge path runs
+        # 1-2-4-3), so swap the last two corners of the ring.
+        a, b, c, d = coords
+        parts.append(
+            f"0\nSOLID\n8\n{layer}\n"
+            f"10\n{a[0]:.1f}\n20\n{a[1]:.1f}\n30\n0.0\n"
+            f"11\n{b[0]:.1f}\n21\n{b[1]:.1f}\n31\n0.0\n"
+            f"12\n{d[0]:.1f}\n22\n{d[1]:.1f}\n32\n0.0\n"
+            f"13\n{c[0]:.1f}\n23\n{c[1]:.1f}\n33\n0.0\n"
+        )
+
+    _line("roads", 0, 0, 100, 0)
+    _line("roads", 0, 0, 100, 100)
+    if add_zero_length_line:
+        _line("roads", 5, 5, 5, 5)
+    if add_far_feature:
+        _line("roads", 10000, 10000, 10100, 10100)
+
+    _line("tmp", 0, 0, 1, 0)
+
+    if small_poly:
+        _solid("buildings", [(0, 0), (2, 0), (2, 2), (0, 2)])
+    _solid("buildings", [(10, 10), (15, 10), (15, 15), (10, 15)])
+
+    parts.append("0\nPOINT\n8\nsurvey_points\n10\n0.0\n20\n0.0\n30\n0.0\n")
+    parts.append("0\nENDSEC\n0\nEOF\n")
+    # Encode once and write the bytes directly, skipping the TextIOWrapper
+    # and its newline translation; the whole file lands in a single write.
+    dxf_path.write_bytes("".join(parts).encode("ascii"))
+
+
 @pytest.fixture(scope="session")
 def make_dxf(tmp_path_factory) -> Callable[..., Path]:
+    # One DXF per flag combination for the whole session. Tests only read
+    # the files, so the same path can be handed out repeatedly instead of
+    # re-running driver setup and feature writes per test.
+    cache: dict[tuple[bool, bool, bool], Path] = {}
+
     def _factory(
         *, add_zero_length_line=False, add_far_feature=False, small_poly=False
+    ) -> Path:
+        key = (add_zero_length_line, add_far_feature, small_poly)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        cache[key] = _build(
+            add_zero_length_line=add_zero_length_line,
+            add_far_feature=add_far_feature,
+            small_poly=small_poly,
+        )
+        return cache[key]
+
+    def _build(
+        *, add_zero_length_line=False, add_far_feature=False, small_poly=False
     ) -> Path:
         d = tmp_path_factory.mktemp("dxfdata")
         dxf_path = d / "input.dxf"
-
-        tried_gdal = False
-        if gdal_can_write_dxf():
-            tried_gdal = True
-            try:
-                write_dxf_with_gdal(
-                    dxf_path,
-                    add_zero_length_line=add_zero_length_line,
-                    add_far_feature=add_far_feature,
-                    small_poly=small_poly,
-                )
-                return dxf_path
-            except Exception:
-                # Clean up partial file so ezdxf can safely overwrite
-                try:
-                    # Python 3.8+: wrap in try/except if needed
-                    dxf_path.unlink(missing_ok=True)
-                except Exception:
-                    pass  # best effort; ezdxf will overwrite anyway
-
-        if ezdxf is not None:
-            write_dxf_with_ezdxf(
-                dxf_path,
-                add_zero_length_line=add_zero_length_line,
-                add_far_feature=add_far_feature,
-                small_poly=small_poly,
-            )
-            return dxf_path
-
-        reason = (
-            "GDAL DXF is unusable (read-only or broken) and ezdxf not installed"
-            if tried_gdal
-            else "GDAL not available and ezdxf not installed"
+        # Write the ASCII template directly: no driver lookup, no per-feature
+        # C calls, no dependency on osgeo or ezdxf being importable. The
+        # driver-based writers above remain available for validating that
+        # the template stays equivalent to driver-produced output.
+        write_dxf_ascii(
+            dxf_path,
+            add_zero_length_line=add_zero_length_line,
+            add_far_feature=add_far_feature,
+            small_poly=small_poly,
         )
-        pytest.skip(f"Cannot create DXF: {reason}")
+        return dxf_path
 
     return _factory
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _gdal_setup():
+    """Register OGR drivers and opt into GDAL exceptions once per session.
+
+    Only relevant when the osgeo bindings are present (the pyogrio path
+    manages its own GDAL initialisation); registering up front means later
+    driver lookups in the DXF writer skip the registration scan.
+    """
+    if ogr is None:
+        return
+    try:
+        from osgeo import gdal  # type: ignore
+
+        ogr.RegisterAll()
+        gdal.UseExceptions()
+    except Exception:
+        pass
+
+
 @pytest.fixture
 def output_dir(tmp_path) -> Path:
     return tmp_path / "output"
 
 
+@pytest.fixture(scope="session")
+def default_extraction(tmp_path_factory, make_dxf, api) -> Path:
+    """
+    Output directory of one default-argument extraction, shared per session.
+
+    Several tests run ``extract_geometries(make_dxf(), output_dir)`` with no
+    further arguments and then only read the results; running that pipeline
+    once and sharing the directory avoids repeating the DXF parse and vector
+    writes per test. Tests that mutate outputs or pass non-default arguments
+    should keep using ``output_dir``.
+    """
+    extract_geometries, *_ = api
+    out_dir = tmp_path_factory.mktemp("shared_extract") / "output"
+    extract_geometries(make_dxf(), out_dir)
+    return out_dir
+
+
+@functools.lru_cache(maxsize=1)
 def import_api():
     try:
         from dxf2geo.extract import extract_geometries  # type: ignore
@@ -30,12 +30,8 @@ def test_filters_can_yield_empty_but_not_error(make_dxf, output_dir, api):
 
 
 @have_gdal_dxf
-def test_export_log_if_written(make_dxf, output_dir, api):
-    extract_geometries, FilterOptions, *_ = api
-    dxf_path = make_dxf()
-
-    extract_geometries(dxf_path, output_dir)
-    log = output_dir / "export.log"
+def test_export_log_if_written(default_extraction):
+    log = default_extraction / "export.log"
     # Some environments may not emit a log; tolerate absence.
     # If present, it should be non-empty.
     if log.exists():
@@ -4,11 +4,8 @@ from .conftest import have_gdal_dxf
 
 
 @have_gdal_dxf
-def test_extract_creates_expected_structure(make_dxf, output_dir, api):
-    extract_geometries, FilterOptions, *_ = api
-    dxf_path = make_dxf()
-
-    extract_geometries(dxf_path, output_dir)
+def test_extract_creates_expected_structure(default_extraction):
+    output_dir = default_extraction
 
     # Must have linestring output; others are optional depending on DXF entity mapping.
     ls_dir = output_dir / "linestring"
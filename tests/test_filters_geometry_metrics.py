@@ -1,10 +1,8 @@
 from __future__ import annotations
 
-from pathlib import Path
-
 import pytest
 
-from .conftest import have_gdal_dxf
+from .conftest import have_gdal_dxf, read_any_vector
 
 try:
     import geopandas as gpd  # type: ignore
@@ -12,14 +10,6 @@ except Exception:
     gpd = None
 
 
-def _read_any_vector(base: Path):
-    shp = base.with_suffix(".shp")
-    gpkg = base.with_suffix(".gpkg")
-    p = shp if shp.exists() else gpkg
-    assert p.exists(), f"Vector dataset not found next to {base}"
-    return gpd.read_file(p)  # type: ignore
-
-
 @have_gdal_dxf
 @pytest.mark.skipif(gpd is None, reason="geopandas not available")
 def test_min_length_filters_short_lines(make_dxf, output_dir, api):
@@ -31,7 +21,7 @@ def test_min_length_filters_short_lines(make_dxf, output_dir, api):
     fo = FilterOptions(min_length=10.0, include_layers=("roads", "tmp"))
     extract_geometries(dxf_path, output_dir, filter_options=fo)
 
-    gdf = _read_any_vector(output_dir / "linestring" / "linestring")
+    gdf = read_any_vector(output_dir / "linestring" / "linestring")
     # Expect the two road lines; the 1-unit tmp line is filtered out.
     assert len(gdf) == 2
 
@@ -46,7 +36,7 @@ def test_drop_zero_length_line(make_dxf, output_dir, api):
     fo = FilterOptions(drop_zero_geom=True, include_layers=("roads",))
     extract_geometries(dxf_path, output_dir, filter_options=fo)
 
-    gdf = _read_any_vector(output_dir / "linestring" / "linestring")
+    gdf = read_any_vector(output_dir / "linestring" / "linestring")
     # Two valid road lines remain; the zero-length one is removed.
     assert len(gdf) == 2
 
@@ -68,6 +58,6 @@ def test_min_area_polygons_if_present(make_dxf, output_dir, api):
             "Polygon output not produced by extractor; area filter not applicable here"
         )
 
-    gdf = _read_any_vector(poly_dir)
+    gdf = read_any_vector(poly_dir)
     # The 2x2 square (area 4) is filtered out; the 5x5 square remains.
     assert len(gdf) == 1
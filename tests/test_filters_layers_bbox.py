@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from pathlib import Path
+import re
 
 import pytest
 
-from .conftest import have_gdal_dxf
+from .conftest import have_gdal_dxf, read_any_vector
 
 try:
     import geopandas as gpd  # type: ignore
@@ -12,14 +12,6 @@ except Exception:
     gpd = None
 
 
-def _read_any_vector(base: Path):
-    shp = base.with_suffix(".shp")
-    gpkg = base.with_suffix(".gpkg")
-    p = shp if shp.exists() else gpkg
-    assert p.exists(), f"Vector dataset not found next to {base}"
-    return gpd.read_file(p)  # type: ignore
-
-
 @have_gdal_dxf
 @pytest.mark.skipif(gpd is None, reason="geopandas not available")
 def test_include_exclude_layers_exact(make_dxf, output_dir, api):
@@ -29,23 +21,28 @@ def test_include_exclude_layers_exact(make_dxf, output_dir, api):
     fo = FilterOptions(include_layers=("roads",), exclude_layers=("tmp",))
     extract_geometries(dxf_path, output_dir, filter_options=fo)
 
-    gdf = _read_any_vector(output_dir / "linestring" / "linestring")
+    gdf = read_any_vector(output_dir / "linestring" / "linestring")
     assert len(gdf) == 2
 
 
 @have_gdal_dxf
 @pytest.mark.skipif(gpd is None, reason="geopandas not available")
-def test_include_exclude_layers_regex(make_dxf, output_dir, api):
+@pytest.mark.parametrize("compiled", [False, True], ids=["str", "re.Pattern"])
+def test_include_exclude_layers_regex(make_dxf, output_dir, api, compiled):
     extract_geometries, FilterOptions, *_ = api
     dxf_path = make_dxf()
 
+    include, exclude = r"(?i)^roads?$", r"(?i)^tmp$"
+    if compiled:
+        # Pre-compiled patterns must be accepted as-is.
+        include, exclude = re.compile(include), re.compile(exclude)
     fo = FilterOptions(
-        include_layer_patterns=(r"(?i)^roads?$",),
-        exclude_layer_patterns=(r"(?i)^tmp$",),
+        include_layer_patterns=(include,),
+        exclude_layer_patterns=(exclude,),
     )
     extract_geometries(dxf_path, output_dir, filter_options=fo)
 
-    gdf = _read_any_vector(output_dir / "linestring" / "linestring")
+    gdf = read_any_vector(output_dir / "linestring" / "linestring")
     assert len(gdf) == 2
 
 
@@ -62,7 +59,7 @@ def test_bbox_filters_out_far_features(make_dxf, output_dir, api):
     )
     extract_geometries(dxf_path, output_dir, filter_options=fo)
 
-    gdf = _read_any_vector(output_dir / "linestring" / "linestring")
+    gdf = read_any_vector(output_dir / "linestring" / "linestring")
     assert len(gdf) == 2
 
     # Safety check: all coordinates lie within the bbox
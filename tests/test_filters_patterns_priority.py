@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from pathlib import Path
+import re
 
 import pytest
 
-from .conftest import have_gdal_dxf
+from .conftest import have_gdal_dxf, read_any_vector
 
 try:
     import geopandas as gpd  # type: ignore
@@ -12,25 +12,22 @@ except Exception:
     gpd = None
 
 
-def _read_any_vector(base: Path):
-    shp = base.with_suffix(".shp")
-    gpkg = base.with_suffix(".gpkg")
-    p = shp if shp.exists() else gpkg
-    assert p.exists(), f"Vector dataset not found next to {base}"
-    return gpd.read_file(p)  # type: ignore
-
-
 @have_gdal_dxf
 @pytest.mark.skipif(gpd is None, reason="geopandas not available")
-def test_layer_regex_is_case_insensitive(make_dxf, output_dir, api):
+@pytest.mark.parametrize(
+    "pattern",
+    [r"(?i)^RoAdS$", re.compile(r"^RoAdS$", re.IGNORECASE)],
+    ids=["str", "re.Pattern"],
+)
+def test_layer_regex_is_case_insensitive(make_dxf, output_dir, api, pattern):
     extract_geometries, FilterOptions, *_ = api
     dxf_path = make_dxf()
 
     # Include "roads" regardless of case
-    fo = FilterOptions(include_layer_patterns=(r"(?i)^RoAdS$",))
+    fo = FilterOptions(include_layer_patterns=(pattern,))
     extract_geometries(dxf_path, output_dir, filter_options=fo)
 
-    gdf = _read_any_vector(output_dir / "linestring" / "linestring")
+    gdf = read_any_vector(output_dir / "linestring" / "linestring")
     # Two road lines expected
     assert len(gdf) == 2
     assert set(gdf["LAYER"].str.lower()) == {"roads"}
@@ -54,5 +51,5 @@ def test_exclude_wins_when_both_include_and_exclude_set(make_dxf, output_dir, ap
     shp = base.with_suffix(".shp")
     gpkg = base.with_suffix(".gpkg")
     if shp.exists() or gpkg.exists():
-        gdf = _read_any_vector(base)
+        gdf = read_any_vector(base)
         assert len(gdf) == 0
@@ -9,15 +9,12 @@ except Exception:
 
 
 @pytest.mark.skipif(gpd is None, reason="geopandas not available")
-def test_load_and_plot_visualisation(make_dxf, output_dir, api, tmp_path):
-    extract_geometries, FilterOptions, load_geometries, plot_geometries = api
+def test_load_and_plot_visualisation(default_extraction, api, tmp_path):
+    *_, load_geometries, plot_geometries = api
     if load_geometries is None or plot_geometries is None:
         pytest.skip("visualise API not present")
 
-    dxf_path = make_dxf()
-    extract_geometries(dxf_path, output_dir)
-
-    gdf = load_geometries(output_dir)
+    gdf = load_geometries(default_extraction)
     assert hasattr(gdf, "geometry")
     assert isinstance(gdf, gpd.GeoDataFrame)
     assert len(gdf) > 0
@@ -27,3 +24,29 @@ def test_load_and_plot_visualisation(make_dxf, output_dir, api, tmp_path):
     assert html_out.exists()
     text = html_out.read_text(encoding="utf-8", errors="ignore")
     assert "<html" in text.lower() or "<div" in text.lower()
+
+
+@pytest.mark.skipif(gpd is None, reason="geopandas not available")
+def test_remove_short_axis_aligned_lines():
+    from shapely.geometry import LineString, Point
+
+    from dxf2geo.visualise import remove_short_axis_aligned_lines
+
+    gdf = gpd.GeoDataFrame(
+        {"label": ["short_h", "short_v", "long_h", "short_diag", "point", "empty"]},
+        geometry=[
+            LineString([(0, 0), (0.5, 0)]),  # short horizontal: dropped
+            LineString([(0, 0), (0, 0.5)]),  # short vertical: dropped
+            LineString([(0, 0), (5, 0)]),  # long horizontal: kept
+            LineString([(0, 0), (0.3, 0.3)]),  # short but diagonal: kept
+            Point(1, 1),  # not a line: kept
+            LineString(),  # empty geometry: kept
+        ],
+    )
+
+    out = remove_short_axis_aligned_lines(gdf, max_length=1.0)
+    assert out["label"].tolist() == ["long_h", "short_diag", "point", "empty"]
+
+    # No lines at all: the frame passes through untouched.
+    points_only = gdf[gdf["label"] == "point"]
+    assert remove_short_axis_aligned_lines(points_only) is points_only